@@ -1,9 +1,22 @@
+import hashlib
+import os
 import streamlit as st
 import pandas as pd
-from datetime import datetime
-from main import fetch_and_process_articles, DEFAULT_DAYS
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from main import fetch_and_process_articles, format_date, DEFAULT_DAYS
 from rank_openai import generate_linkedin_post
 
+# Stylesheet injected into every page
+STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'style.css')
+
+# Number of top stories and maximum number of trending articles shown
+TOP_STORIES_COUNT = 5
+MAX_TRENDING_ARTICLES = 50
+
+# Maximum number of LinkedIn posts generated concurrently
+LINKEDIN_MAX_WORKERS = 5
+
 # Page configuration
 st.set_page_config(
     page_title="WarpzoneAI - AI Gaming Intelligence",
@@ -11,123 +24,58 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
-    <style>
-    .main {
-        padding: 2rem;
-    }
-    .article-card {
-        background-color: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        margin-bottom: 1rem;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    .article-title {
-        color: #1f1f1f;
-        font-size: 1.2rem;
-        font-weight: bold;
-        margin-bottom: 0.5rem;
-    }
-    .article-meta {
-        color: #666;
-        font-size: 0.9rem;
-        margin-bottom: 1rem;
-    }
-    .article-score {
-        color: #0066cc;
-        font-weight: bold;
-    }
-    .article-bullets {
-        margin: 1rem 0;
-        line-height: 1.6;
-        color: #333;
-    }
-    .article-bullets p {
-        margin-bottom: 0.5rem;
-    }
-    .article-bullets br {
-        display: block;
-        content: "";
-        margin-top: 0.5rem;
-    }
-    .article-bullets .bullet-point {
-        display: block;
-        margin-bottom: 0.5rem;
-    }
-    .sidebar-content {
-        padding: 1rem;
-    }
-    .page-description {
-        color: #666;
-        font-style: italic;
-        margin-bottom: 2rem;
-        padding: 1rem;
-        background-color: #f8f9fa;
-        border-radius: 5px;
-    }
-    .linkedin-post {
-        background-color: white;
-        padding: 2rem;
-        border-radius: 10px;
-        margin-bottom: 2rem;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        border-left: 5px solid #0a66c2;
-    }
-    .linkedin-post-header {
-        display: flex;
-        align-items: center;
-        margin-bottom: 1rem;
-    }
-    .copy-button {
-        background-color: #0a66c2;
-        color: white;
-        padding: 0.5rem 1rem;
-        border-radius: 5px;
-        text-decoration: none;
-        float: right;
-        margin-top: 1rem;
-    }
-    .copy-button:hover {
-        background-color: #004182;
-    }
-    .sidebar-section {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 5px;
-        margin-bottom: 1rem;
-    }
-    .feedly-link {
-        display: inline-block;
-        padding: 8px 16px;
-        background-color: #2bb24c;
-        color: white !important;
-        text-decoration: none;
-        border-radius: 5px;
-        margin-top: 1rem;
-        font-weight: 500;
-        transition: background-color 0.2s ease;
-    }
+@st.cache_data(show_spinner=False)
+def _load_css() -> str:
+    """Read the stylesheet once; later reruns reuse the cached markup."""
+    with open(STYLESHEET_PATH, encoding='utf-8') as f:
+        return f"<style>{f.read()}</style>"
 
-    .feedly-link:hover {
-        background-color: #249540;
-        text-decoration: none;
-        color: white !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+# Custom CSS, re-emitted on every rerun since Streamlit clears elements that are not redrawn
+st.markdown(_load_css(), unsafe_allow_html=True)
 
-def format_date(date_str):
-    """Format date string to a more readable format."""
-    try:
-        date = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-        return date.strftime('%B %d, %Y')
-    except:
-        return date_str
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def _cached_fetch(days: int, use_cache: bool = True) -> pd.DataFrame:
+    """
+    Fetch and rank articles, reusing results for the same window across reruns and sessions.
+    Must not call st.* itself: cached element calls cannot be replayed into the caller's placeholders.
+    """
+    return fetch_and_process_articles(days_to_fetch=days, use_cache=use_cache)
 
-def display_article(article, show_linkedin_button=False, show_delete_button=False):
-    """Display an article in a card format."""
+def is_fully_scored(df: pd.DataFrame) -> bool:
+    """Whether every article got a GPT score (a failed scoring batch leaves its articles at <NA>)."""
+    return df.empty or ('GPT_Pertinence' in df.columns and not df['GPT_Pertinence'].isna().any())
+
+def article_key(url: str) -> str:
+    """Short, stable key for an article URL, used for widget and cache keys."""
+    return hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+
+@st.cache_data(ttl=7 * 24 * 60 * 60, show_spinner=False)
+def _cached_linkedin_post(url: str, title: str, summary: str, keywords: str) -> str:
+    """Generate a LinkedIn post once per article, keyed on plain strings rather than the pandas row."""
+    return generate_linkedin_post({'URL': url, 'Title': title, 'Summary': summary, 'Keywords': keywords})
+
+def linkedin_post_for(article):
+    """Return the (cached) LinkedIn post for an article row."""
+    return _cached_linkedin_post(article['URL'], article['Title'], article['Summary'], article['Keywords'])
+
+def compute_article_views(df):
+    """Split the ranked articles once into the slices each page displays."""
+    ranked = df.nlargest(TOP_STORIES_COUNT + MAX_TRENDING_ARTICLES, 'GPT_Pertinence')
+    top_stories = ranked.head(TOP_STORIES_COUNT)
+    st.session_state.top_stories = top_stories[top_stories['GPT_Pertinence'] > 7]
+    trending = ranked[ranked['GPT_Pertinence'] >= 7]
+    st.session_state.trending_articles = trending.iloc[TOP_STORIES_COUNT:]
+
+def filter_articles_by_days(df, days):
+    """Keep the articles published within the last `days` days."""
+    if df.empty:
+        return df
+    cutoff = (datetime.utcnow() - timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
+    # Dates are zero-padded so string order is chronological; undated articles are kept
+    return df[df['Publication Date'] >= cutoff]
+
+def build_article_html(article):
+    """Build the HTML of an article card."""
     # Format bullet points with proper line breaks
     bullet_points = article.get('Bullet_Points', '')
     if bullet_points and isinstance(bullet_points, str):
@@ -142,8 +90,24 @@ def display_article(article, show_linkedin_button=False, show_delete_button=Fals
     else:
         bullet_points_html = f"<p>{article['Summary'][:300]}...</p>"
 
+    return f"""
+        <div class="article-card">
+            <div class="article-title">{article['Title']}</div>
+            <div class="article-meta">
+                Published: {format_date(article['Publication Date'])} | 
+                Score: <span class="article-score">{article['GPT_Pertinence']}/10</span>
+            </div>
+            <div class="article-bullets">
+                {bullet_points_html}
+            </div>
+            <a href="{article['URL']}" target="_blank">Read more →</a>
+        </div>
+    """
+
+def display_article(article, show_linkedin_button=False, show_delete_button=False):
+    """Display an article in a card format."""
     # Generate unique key for this article's LinkedIn post
-    article_key = f"linkedin_{article['URL']}"
+    linkedin_key = f"linkedin_{article_key(article['URL'])}"
 
     # Create a container for the article card
     article_container = st.container()
@@ -153,40 +117,16 @@ def display_article(article, show_linkedin_button=False, show_delete_button=Fals
         if show_delete_button:
             col1, col2 = st.columns([0.9, 0.1])
             with col1:
-                st.markdown(f"""
-                    <div class="article-card">
-                        <div class="article-title">{article['Title']}</div>
-                        <div class="article-meta">
-                            Published: {format_date(article['Publication Date'])} | 
-                            Score: <span class="article-score">{article['GPT_Pertinence']}/10</span>
-                        </div>
-                        <div class="article-bullets">
-                            {bullet_points_html}
-                        </div>
-                        <a href="{article['URL']}" target="_blank">Read more →</a>
-                    </div>
-                """, unsafe_allow_html=True)
+                st.markdown(build_article_html(article), unsafe_allow_html=True)
             with col2:
-                if st.button("❌", key=f"delete_{article['URL']}"):
+                if st.button("❌", key=f"delete_{article_key(article['URL'])}"):
                     # Add article to deleted articles in session state
                     if 'deleted_articles' not in st.session_state:
                         st.session_state.deleted_articles = set()
                     st.session_state.deleted_articles.add(article['URL'])
                     st.rerun()
         else:
-            st.markdown(f"""
-                <div class="article-card">
-                    <div class="article-title">{article['Title']}</div>
-                    <div class="article-meta">
-                        Published: {format_date(article['Publication Date'])} | 
-                        Score: <span class="article-score">{article['GPT_Pertinence']}/10</span>
-                    </div>
-                    <div class="article-bullets">
-                        {bullet_points_html}
-                    </div>
-                    <a href="{article['URL']}" target="_blank">Read more →</a>
-                </div>
-            """, unsafe_allow_html=True)
+            st.markdown(build_article_html(article), unsafe_allow_html=True)
 
     # Add LinkedIn post generation button if requested
     if show_linkedin_button:
@@ -194,15 +134,15 @@ def display_article(article, show_linkedin_button=False, show_delete_button=Fals
         if 'linkedin_posts' not in st.session_state:
             st.session_state.linkedin_posts = {}
 
-        if st.button("🔄 Generate LinkedIn Post", key=article_key):
+        if st.button("🔄 Generate LinkedIn Post", key=linkedin_key):
             with st.spinner("Generating LinkedIn post..."):
-                post_content = generate_linkedin_post(article)
-                st.session_state.linkedin_posts[article_key] = post_content
+                post_content = linkedin_post_for(article)
+                st.session_state.linkedin_posts[linkedin_key] = post_content
                 st.success("LinkedIn post generated!")
 
         # Display the generated post if it exists
-        if article_key in st.session_state.linkedin_posts:
-            display_linkedin_post(article, st.session_state.linkedin_posts[article_key])
+        if linkedin_key in st.session_state.linkedin_posts:
+            display_linkedin_post(article, st.session_state.linkedin_posts[linkedin_key])
 
 def display_linkedin_post(article, post_content):
     """Display a LinkedIn post with copy button."""
@@ -221,7 +161,7 @@ def display_linkedin_post(article, post_content):
         """, unsafe_allow_html=True)
         
         # Add the copy button using Streamlit's native button
-        if st.button("📋 Copy to Clipboard", key=f"copy_{article['URL']}"):
+        if st.button("📋 Copy to Clipboard", key=f"copy_{article_key(article['URL'])}"):
             st.write("Copied to clipboard!")
             st.code(post_content, language=None)
 
@@ -229,6 +169,10 @@ def main():
     # Initialize session state for articles and LinkedIn posts
     if 'articles_df' not in st.session_state:
         st.session_state.articles_df = None
+    if 'raw_articles_df' not in st.session_state:
+        st.session_state.raw_articles_df = None
+    if 'last_fetched_days' not in st.session_state:
+        st.session_state.last_fetched_days = 0
     if 'linkedin_posts' not in st.session_state:
         st.session_state.linkedin_posts = {}
     if 'days_to_fetch' not in st.session_state:
@@ -266,8 +210,18 @@ def main():
         # Update session state if days changed
         if days_to_fetch != st.session_state.days_to_fetch:
             st.session_state.days_to_fetch = days_to_fetch
-            st.session_state.articles_df = None  # Reset articles when days change
-            st.session_state.linkedin_posts = {}  # Reset LinkedIn posts
+            if st.session_state.raw_articles_df is not None and days_to_fetch <= st.session_state.last_fetched_days:
+                # Narrower window: filter the articles already fetched instead of refetching
+                st.session_state.articles_df = filter_articles_by_days(st.session_state.raw_articles_df, days_to_fetch)
+                compute_article_views(st.session_state.articles_df)
+            else:
+                st.session_state.articles_df = None  # Reset articles when the window widens
+                st.session_state.linkedin_posts = {}  # Reset LinkedIn posts
+        
+        force_refresh = st.checkbox(
+            "♻️ Force refresh",
+            help="Ignore cached results and fetch and score the articles again"
+        )
         
         # Fetch articles button
         if st.button("🔍 Fetch New Articles"):
@@ -282,12 +236,20 @@ def main():
                 st.session_state.articles_df = None
                 st.session_state.linkedin_posts = {}
                 
-                # Fetch articles with progress updates
-                feedly_container.info("📡 Connecting to Feedly API...")
-                st.session_state.articles_df = fetch_and_process_articles(
-                    days_to_fetch=st.session_state.days_to_fetch,
-                    progress_callback=lambda msg: feedly_container.info(msg)
+                # Fetch articles; progress is shown here since the cached function cannot draw
+                feedly_container.info("📡 Fetching articles from Feedly and ranking them with GPT...")
+                if force_refresh:
+                    _cached_fetch.clear()
+                st.session_state.raw_articles_df = _cached_fetch(
+                    st.session_state.days_to_fetch, use_cache=not force_refresh
                 )
+                if not is_fully_scored(st.session_state.raw_articles_df):
+                    # Drop the partial result so the next fetch scores the articles again
+                    _cached_fetch.clear()
+                    st.warning("⚠️ Some articles could not be scored; fetch again to retry them.")
+                st.session_state.last_fetched_days = st.session_state.days_to_fetch
+                st.session_state.articles_df = st.session_state.raw_articles_df
+                compute_article_views(st.session_state.articles_df)
                 
                 # Clear progress containers
                 init_container.empty()
@@ -312,6 +274,8 @@ def main():
         st.info("👈 Click 'Fetch New Articles' in the sidebar to load articles")
     else:
         df = st.session_state.articles_df
+        if 'top_stories' not in st.session_state:
+            compute_article_views(df)
         
         if page == "🌟 Top Stories":
             st.subheader("Top Stories")
@@ -330,13 +294,13 @@ def main():
             """, unsafe_allow_html=True)
             
             # Get top articles excluding deleted ones
-            top_articles = df[df['GPT_Pertinence'] > 7].head(5)
+            top_articles = st.session_state.top_stories
             top_articles = top_articles[~top_articles['URL'].isin(st.session_state.deleted_articles)]
 
             # If we have deleted articles, try to replace them with trending articles
             if len(top_articles) < 5:
                 # Get trending articles that are not in top stories and not deleted
-                trending_articles = df[df['GPT_Pertinence'] >= 7].iloc[5:]
+                trending_articles = st.session_state.trending_articles
                 trending_articles = trending_articles[~trending_articles['URL'].isin(st.session_state.deleted_articles)]
                 trending_articles = trending_articles[~trending_articles['URL'].isin(st.session_state.moved_to_top)]
                 
@@ -346,12 +310,11 @@ def main():
                     additional_articles = trending_articles.head(num_to_add)
                     
                     # Add the moved articles to the moved_to_top set
-                    for _, article in additional_articles.iterrows():
-                        st.session_state.moved_to_top.add(article['URL'])
+                    st.session_state.moved_to_top.update(additional_articles['URL'])
                     
                     top_articles = pd.concat([top_articles, additional_articles])
 
-            for _, article in top_articles.iterrows():
+            for article in top_articles.to_dict('records'):
                 display_article(article, show_delete_button=True)
                 
         elif page == "📰 Trending Articles":
@@ -365,14 +328,14 @@ def main():
             """, unsafe_allow_html=True)
             
             # Get trending articles excluding deleted ones, top stories, and moved articles
-            trending_articles = df[df['GPT_Pertinence'] >= 7].iloc[5:]
+            trending_articles = st.session_state.trending_articles
             trending_articles = trending_articles[~trending_articles['URL'].isin(st.session_state.deleted_articles)]
             trending_articles = trending_articles[~trending_articles['URL'].isin(st.session_state.moved_to_top)]
             
             if len(trending_articles) == 0:
                 st.info("No trending articles found at the moment.")
             else:
-                for _, article in trending_articles.iterrows():
+                for article in trending_articles.to_dict('records'):
                     display_article(article, show_linkedin_button=True)
         
         else:  # LinkedIn Posts
@@ -385,20 +348,32 @@ def main():
                 </div>
             """, unsafe_allow_html=True)
             
-            top_articles = df[df['GPT_Pertinence'] > 7].head(5)  # Get top key stories
+            top_articles = st.session_state.top_stories  # Get top key stories
             
             with st.spinner('Generating LinkedIn posts...'):
-                for _, article in top_articles.iterrows():
-                    article_id = article['URL']  # Use URL as unique identifier
-                    
-                    # Generate post if not already generated
-                    if article_id not in st.session_state.linkedin_posts:
+                # Generate the missing posts concurrently (URL is the unique identifier).
+                # Worker threads have no script run context, so they call the SQLite-cached
+                # generator directly instead of the st.cache_data wrapper.
+                to_generate = [
+                    article for article in top_articles.to_dict('records')
+                    if article['URL'] not in st.session_state.linkedin_posts
+                ]
+                if to_generate:
+                    with ThreadPoolExecutor(max_workers=LINKEDIN_MAX_WORKERS) as executor:
+                        futures = {
+                            article['URL']: executor.submit(generate_linkedin_post, article)
+                            for article in to_generate
+                        }
+                    for article_id, future in futures.items():
                         try:
-                            post_content = generate_linkedin_post(article)
-                            st.session_state.linkedin_posts[article_id] = post_content
+                            st.session_state.linkedin_posts[article_id] = future.result()
                         except Exception as e:
                             st.error(f"Error generating LinkedIn post: {str(e)}")
-                            continue
+
+                for article in top_articles.to_dict('records'):
+                    article_id = article['URL']
+                    if article_id not in st.session_state.linkedin_posts:
+                        continue
                     
                     # Display the post using display_linkedin_post instead of display_article
                     display_linkedin_post(article, st.session_state.linkedin_posts[article_id])
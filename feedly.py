@@ -1,6 +1,10 @@
+import orjson
 import requests
+import threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional
 from urllib.parse import quote
 from datetime import datetime, timedelta
 from config import CLIENT_ID, CLIENT_SECRET, REFRESH_TOKEN, STREAM_ID
@@ -9,8 +13,21 @@ from config import CLIENT_ID, CLIENT_SECRET, REFRESH_TOKEN, STREAM_ID
 FEEDLY_API_BASE_URL = 'https://cloud.feedly.com/v3'
 FEEDLY_AUTH_URL = 'https://api.feedly.com/v3/auth/token'
 DEFAULT_TOKEN_EXPIRY = 3600  # seconds
-DEFAULT_BATCH_SIZE = 100
+DEFAULT_BATCH_SIZE = 1000  # Feedly's maximum page size
 DAYS_TO_FETCH = 7
+TOKEN_REFRESH_MARGIN = 60  # seconds before expiry at which the token is renewed
+
+# Keep-alive session reused for every Feedly call, retrying rate limits and gateway errors with backoff
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+))
+
+# Access token shared by every session in the process; guarded so only one refresh runs at a time
+_token_state = {'access_token': None, 'expiry': 0.0}
+_token_lock = threading.Lock()
 
 class FeedlyAPIError(Exception):
     """Custom exception for Feedly API errors."""
@@ -38,7 +55,7 @@ def refresh_access_token(refresh_token: str, client_id: str, client_secret: str)
             'client_secret': client_secret,
             'grant_type': 'refresh_token',
         }
-        response = requests.post(FEEDLY_AUTH_URL, data=payload)
+        response = _SESSION.post(FEEDLY_AUTH_URL, data=payload)
         response.raise_for_status()
         tokens = response.json()
         
@@ -51,14 +68,33 @@ def refresh_access_token(refresh_token: str, client_id: str, client_secret: str)
         
     except requests.exceptions.RequestException as e:
         raise FeedlyAPIError(f"Failed to refresh token: {str(e)}")
+
+def ensure_token(rejected_token: Optional[str] = None) -> str:
+    """
+    Return a valid access token, refreshing it only when it is missing, about to expire,
+    or was just rejected by the API.
+    
+    Args:
+        rejected_token (Optional[str]): A token the API answered with 401; forces a refresh
+            unless another caller already replaced it
+        
+    Returns:
+        str: The current access token
+        
+    Raises:
+        FeedlyAPIError: If the token refresh fails
+    """
+    with _token_lock:
+        expired = time.time() >= _token_state['expiry'] - TOKEN_REFRESH_MARGIN
+        rejected = rejected_token is not None and rejected_token == _token_state['access_token']
+        if _token_state['access_token'] is None or expired or rejected:
+            _token_state['access_token'], _token_state['expiry'] = refresh_access_token(
+                REFRESH_TOKEN, CLIENT_ID, CLIENT_SECRET
+            )
+        return _token_state['access_token']
     
 def get_feedly_articles(
     stream_id: str,
-    access_token: str,
-    token_expiry: float,
-    refresh_token: str,
-    client_id: str,
-    client_secret: str,
     days: int = DAYS_TO_FETCH
 ) -> List[Dict[str, Any]]:
     """
@@ -67,11 +103,6 @@ def get_feedly_articles(
     
     Args:
         stream_id (str): The ID of the Feedly stream
-        access_token (str): The current access token
-        token_expiry (float): The timestamp when the token expires
-        refresh_token (str): The refresh token
-        client_id (str): The client ID
-        client_secret (str): The client secret
         days (int, optional): Number of days to fetch articles for. Defaults to 7.
         
     Returns:
@@ -88,9 +119,7 @@ def get_feedly_articles(
         batch_count = 0
 
         while True:
-            if time.time() >= token_expiry:
-                print("⏰ Token expired, refreshing...")
-                access_token, token_expiry = refresh_access_token(refresh_token, client_id, client_secret)
+            access_token = ensure_token()
 
             headers = {
                 'Authorization': f'Bearer {access_token}',
@@ -105,7 +134,7 @@ def get_feedly_articles(
             if continuation:
                 params['continuation'] = continuation
 
-            response = requests.get(
+            response = _SESSION.get(
                 f'{FEEDLY_API_BASE_URL}/streams/contents',
                 headers=headers,
                 params=params
@@ -113,11 +142,11 @@ def get_feedly_articles(
 
             if response.status_code == 401:
                 print("🔐 Token expired (401), refreshing...")
-                access_token, token_expiry = refresh_access_token(refresh_token, client_id, client_secret)
+                ensure_token(rejected_token=access_token)
                 continue
 
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             items = data.get('items', [])
             all_articles.extend(items)
             batch_count += 1
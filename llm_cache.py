@@ -0,0 +1,162 @@
+import hashlib
+import json
+import numpy as np
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Any, Dict, List, Optional
+
+# SQLite file holding cached OpenAI replies, shared by every process on the host
+CACHE_PATH = os.path.join('.cache', 'openai_responses.sqlite3')
+DEFAULT_TTL = 7 * 24 * 60 * 60  # seconds
+
+def request_key(model: str, messages: List[Dict[str, Any]], temperature: float) -> str:
+    """
+    Build the cache key of a chat completion request.
+
+    Args:
+        model (str): The model name
+        messages (List[Dict[str, Any]]): The chat messages sent to the model
+        temperature (float): The sampling temperature
+
+    Returns:
+        str: SHA-256 hex digest identifying the request
+    """
+    payload = model + json.dumps(messages, sort_keys=True) + str(temperature)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database, creating it on first use."""
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    connection = sqlite3.connect(CACHE_PATH, timeout=10)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS responses "
+        "(hash TEXT PRIMARY KEY, response TEXT NOT NULL, created_at INTEGER NOT NULL)"
+    )
+    return connection
+
+def get_cached_reply(key: str, max_age: float = DEFAULT_TTL) -> Optional[str]:
+    """
+    Return the cached reply for a request key if it is younger than `max_age` seconds.
+
+    Args:
+        key (str): Key returned by request_key
+        max_age (float): Maximum age of the cached reply in seconds
+
+    Returns:
+        Optional[str]: The cached reply, or None on a miss or cache error
+    """
+    try:
+        with closing(_connect()) as connection, connection:
+            row = connection.execute(
+                "SELECT response FROM responses WHERE hash = ? AND created_at >= ?",
+                (key, int(time.time() - max_age))
+            ).fetchone()
+        return row[0] if row else None
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not read response cache: {str(e)}")
+        return None
+
+def store_reply(key: str, reply: str) -> None:
+    """
+    Store the reply of a request, replacing any previous entry.
+
+    Args:
+        key (str): Key returned by request_key
+        reply (str): The model reply to cache
+    """
+    try:
+        with closing(_connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (hash, response, created_at) VALUES (?, ?, ?)",
+                (key, reply, int(time.time()))
+            )
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not write response cache: {str(e)}")
+
+def _connect_semantic() -> sqlite3.Connection:
+    """Open the cache database with the table of embedded, already-scored articles."""
+    connection = _connect()
+    columns = [row[1] for row in connection.execute("PRAGMA table_info(semantic_scores)")]
+    if columns and 'scorer' not in columns:
+        # Entries from before scores were keyed on their scorer cannot be attributed to one
+        connection.execute("DROP TABLE semantic_scores")
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS semantic_scores "
+        "(embedding BLOB NOT NULL, score INTEGER NOT NULL, scorer TEXT NOT NULL, created_at INTEGER NOT NULL)"
+    )
+    return connection
+
+def lookup_semantic_scores(
+    embeddings: np.ndarray,
+    threshold: float,
+    scorer: str,
+    max_age: float = DEFAULT_TTL
+) -> List[Optional[int]]:
+    """
+    Find, for each embedding, the score of the most similar article previously scored by `scorer`.
+
+    Args:
+        embeddings (np.ndarray): L2-normalized float32 embeddings, one row per article
+        threshold (float): Minimum cosine similarity for a cached score to be reused
+        scorer (str): Identifies the model and prompt the scores must come from
+        max_age (float): Maximum age of the cached entries in seconds
+
+    Returns:
+        List[Optional[int]]: The reused score per article, or None when nothing is similar enough
+    """
+    misses = [None] * len(embeddings)
+    try:
+        with closing(_connect_semantic()) as connection, connection:
+            rows = connection.execute(
+                "SELECT embedding, score FROM semantic_scores WHERE scorer = ? AND created_at >= ?",
+                (scorer, int(time.time() - max_age))
+            ).fetchall()
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not read semantic cache: {str(e)}")
+        return misses
+
+    # Ignore entries produced by an embedding model with another dimension
+    rows = [(np.frombuffer(blob, dtype=np.float32), score) for blob, score in rows]
+    rows = [(vector, score) for vector, score in rows if vector.shape[0] == embeddings.shape[1]]
+    if not rows:
+        return misses
+
+    cached_vectors = np.vstack([vector for vector, _ in rows])
+    cached_scores = [score for _, score in rows]
+    similarities = embeddings @ cached_vectors.T
+    best = similarities.argmax(axis=1)
+    return [
+        cached_scores[j] if similarities[i, j] >= threshold else None
+        for i, j in enumerate(best)
+    ]
+
+def store_semantic_scores(
+    embeddings: np.ndarray,
+    scores: List[int],
+    scorer: str,
+    max_age: float = DEFAULT_TTL
+) -> None:
+    """
+    Remember the scores of newly scored articles and drop entries older than `max_age`.
+
+    Args:
+        embeddings (np.ndarray): L2-normalized float32 embeddings, one row per article
+        scores (List[int]): The score of each article
+        scorer (str): Identifies the model and prompt that produced the scores
+        max_age (float): Age in seconds after which entries are deleted
+    """
+    now = int(time.time())
+    try:
+        with closing(_connect_semantic()) as connection, connection:
+            connection.execute("DELETE FROM semantic_scores WHERE created_at < ?", (now - int(max_age),))
+            connection.executemany(
+                "INSERT INTO semantic_scores (embedding, score, scorer, created_at) VALUES (?, ?, ?, ?)",
+                [
+                    (vector.astype(np.float32).tobytes(), int(score), scorer, now)
+                    for vector, score in zip(embeddings, scores)
+                ]
+            )
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not write semantic cache: {str(e)}")
@@ -1,54 +1,93 @@
 import datetime
+import functools
+import hashlib
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from bs4 import BeautifulSoup
-from feedly import refresh_access_token, get_feedly_articles
-from rank_openai import batch_gpt_scoring, generate_bullet_points_for_top_articles, DEFAULT_BATCH_SIZE
-from typing import List, Dict, Any, Callable, Optional
+from feedly import get_feedly_articles
+from rank_openai import (
+    batch_gpt_scoring, generate_bullet_points_for_top_articles, BulletPointPrefetcher, DEFAULT_BATCH_SIZE
+)
+from typing import List, Dict, Any, Callable, Optional, Tuple
+from urllib.parse import urlparse
 import os
+import tempfile
+import time
 from dotenv import load_dotenv
-from config import DEFAULT_DAYS
-
-# Load environment variables
-load_dotenv()
-
-# Authentication parameters
-CLIENT_ID = os.getenv('FEEDLY_CLIENT_ID')
-CLIENT_SECRET = os.getenv('FEEDLY_CLIENT_SECRET')
-REFRESH_TOKEN = os.getenv('FEEDLY_REFRESH_TOKEN')
-STREAM_ID = os.getenv('FEEDLY_STREAM_ID')
+from config import DEFAULT_DAYS, check_environment_variables
 
 # Feedly stream configuration
 COUNT = 250
 
-# Get initial access token
-ACCESS_TOKEN, TOKEN_EXPIRY = refresh_access_token(REFRESH_TOKEN, CLIENT_ID, CLIENT_SECRET)
-
-def check_environment_variables():
-    """Check if all required environment variables are set."""
-    required_vars = [
-        'OPENAI_API_KEY',
-        'FEEDLY_CLIENT_ID',
-        'FEEDLY_CLIENT_SECRET',
-        'FEEDLY_REFRESH_TOKEN',
-        'FEEDLY_STREAM_ID'
-    ]
-    
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
-    
-    if missing_vars:
-        raise EnvironmentError(
-            f"Missing required environment variables: {', '.join(missing_vars)}\n"
-            "Please check your .env file or environment variables."
-        )
+# Above this many articles, HTML cleaning is spread across worker processes
+PARALLEL_CLEAN_THRESHOLD = 200
+PARALLEL_CLEAN_CHUNKSIZE = 32
+
+# Columns produced by extract_article_data, in display order
+ARTICLE_COLUMNS = [
+    'Title', 'URL', 'Content', 'Author', 'Summary',
+    'Publication Date', 'Keywords', 'Mentioned Entities', 'Score'
+]
 
-# Call this function at startup
-check_environment_variables()
+# On-disk cache of processed articles, reused across restarts and replicas
+CACHE_DIR = '.cache'
+CACHE_MAX_AGE = 60 * 60  # seconds
+
+@functools.cache
+def _config() -> Dict[str, str]:
+    """Load and validate the environment on first use rather than at import time."""
+    load_dotenv()
+    check_environment_variables()
+    return {'FEEDLY_STREAM_ID': os.getenv('FEEDLY_STREAM_ID')}
 
 def clean_html_content(content):
     """Clean HTML content by removing HTML tags and extra whitespace."""
     if not isinstance(content, str) or not content.strip():
         return ''
-    return BeautifulSoup(content, "html.parser").get_text().strip()
+    # Plain text (no tags, no entities to decode) needs no parsing
+    if '<' not in content and '&' not in content:
+        return content.strip()
+    return BeautifulSoup(content, "lxml").get_text(" ", strip=True)
+
+def clean_html_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Clean HTML in the given columns, using a process pool for large DataFrames.
+    
+    Args:
+        df (pd.DataFrame): DataFrame containing the columns to clean
+        columns (List[str]): Names of the columns holding HTML content
+        
+    Returns:
+        pd.DataFrame: The same DataFrame with cleaned columns
+    """
+    if len(df) <= PARALLEL_CLEAN_THRESHOLD:
+        for column in columns:
+            df[column] = [clean_html_content(text) for text in df[column].tolist()]
+        return df
+
+    with ProcessPoolExecutor() as executor:
+        for column in columns:
+            df[column] = list(executor.map(
+                clean_html_content, df[column].tolist(), chunksize=PARALLEL_CLEAN_CHUNKSIZE
+            ))
+    return df
+
+@functools.lru_cache(maxsize=2048)
+def format_date(date_str):
+    """Format date string to a more readable format."""
+    try:
+        date = datetime.datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
+        return date.strftime('%B %d, %Y')
+    except (TypeError, ValueError):
+        return date_str
+
+def article_dedup_keys(row: Dict[str, Any]) -> Tuple[str, str]:
+    """Return the normalized (URL, title) keys used to detect duplicate articles."""
+    url = row.get('URL') or ''
+    parsed = urlparse(url.strip().lower())
+    url_key = f"{parsed.netloc}{parsed.path.rstrip('/')}" if parsed.netloc else ''
+    title_key = ' '.join((row.get('Title') or '').split()).lower()
+    return url_key, title_key
 
 def extract_article_data(article):
     """Extract relevant information from a Feedly article."""
@@ -72,9 +111,16 @@ def extract_article_data(article):
         'Score': {topic["label"]: topic["score"] for topic in article.get("commonTopics", []) if "score" in topic}
     }
 
+def _articles_cache_path(stream_id: str, days: int) -> str:
+    """Return the disk cache file for a stream, the current UTC day and a fetch window."""
+    stream_hash = hashlib.blake2b(stream_id.encode(), digest_size=8).hexdigest()
+    today = datetime.datetime.utcnow().strftime('%Y-%m-%d')
+    return os.path.join(CACHE_DIR, f"articles_{stream_hash}_{today}_{days}.pkl")
+
 def fetch_and_process_articles(
     days_to_fetch: int = 7,
-    progress_callback: Optional[Callable[[str], None]] = None
+    progress_callback: Optional[Callable[[str], None]] = None,
+    use_cache: bool = True
 ) -> pd.DataFrame:
     """
     Fetch articles from Feedly and process them with GPT ranking.
@@ -82,6 +128,7 @@ def fetch_and_process_articles(
     Args:
         days_to_fetch (int): Number of days to fetch articles for
         progress_callback (Optional[Callable[[str], None]]): Callback function to report progress
+        use_cache (bool): Reuse a processed result from disk if it is less than CACHE_MAX_AGE old
         
     Returns:
         pd.DataFrame: Processed articles with GPT rankings
@@ -94,14 +141,19 @@ def fetch_and_process_articles(
             print(msg)
     
     try:
+        stream_id = _config()['FEEDLY_STREAM_ID']
+        cache_path = _articles_cache_path(stream_id, days_to_fetch)
+        if use_cache and os.path.exists(cache_path) and time.time() - os.path.getmtime(cache_path) < CACHE_MAX_AGE:
+            try:
+                cached_df = pd.read_pickle(cache_path)
+                log_progress("💾 Loaded processed articles from disk cache")
+                return cached_df
+            except Exception as e:  # Unreadable or corrupt pickle: fetch again
+                print(f"⚠️ Could not read articles cache: {str(e)}")
+
         # Fetch articles from Feedly
         articles = get_feedly_articles(
-            stream_id=STREAM_ID,
-            access_token=ACCESS_TOKEN,
-            token_expiry=TOKEN_EXPIRY,
-            refresh_token=REFRESH_TOKEN,
-            client_id=CLIENT_ID,
-            client_secret=CLIENT_SECRET,
+            stream_id=stream_id,
             days=days_to_fetch
         )
         
@@ -109,25 +161,55 @@ def fetch_and_process_articles(
             log_progress("No articles found.")
             return pd.DataFrame()
         
-        # Convert to DataFrame and extract article data
-        articles_data = [extract_article_data(article) for article in articles]
-        df = pd.DataFrame(articles_data)
+        # Extract article data column-wise, skipping empty articles and duplicates
+        # (same normalized URL or title) before anything expensive runs on them
+        columns = {name: [] for name in ARTICLE_COLUMNS}
+        seen_urls, seen_titles = set(), set()
+        for article in articles:
+            row = extract_article_data(article)
+            if not row['Summary'] and not row['Content']:
+                continue
+            url_key, title_key = article_dedup_keys(row)
+            if (url_key and url_key in seen_urls) or (title_key and title_key in seen_titles):
+                continue
+            seen_urls.add(url_key)
+            seen_titles.add(title_key)
+            for name in ARTICLE_COLUMNS:
+                columns[name].append(row[name])
+        df = pd.DataFrame(columns)
         
-        # Remove duplicate articles based on title
-        df = df.drop_duplicates(subset=['Title'], keep='first')
+        # Clean HTML content of the remaining rows only
+        df = clean_html_columns(df, ['Summary', 'Content'])
         
-        # Clean HTML content
-        df['Summary'] = df['Summary'].apply(clean_html_content)
-        df['Content'] = df['Content'].apply(clean_html_content)
-        
-        # First phase: Score all articles
+        # First phase: Score all articles, summarizing the leading ones while the rest are scored
         log_progress("🤖 Starting article scoring...")
-        df = batch_gpt_scoring(df, column='Summary')
+        prefetcher = BulletPointPrefetcher(df, column='Content', top_n=5)
+        try:
+            df = batch_gpt_scoring(df, column='Summary', batch_size=DEFAULT_BATCH_SIZE, on_score=prefetcher.offer)
+        finally:
+            prefetcher.close()
         
         # Second phase: Generate bullet points for top 5 articles
         log_progress("📝 Generating bullet points for top articles...")
         df = generate_bullet_points_for_top_articles(df, column='Content', top_n=5)
         
+        # Only persist complete results, so a transient OpenAI failure is retried on the next fetch
+        if 'GPT_Pertinence' not in df.columns or df['GPT_Pertinence'].isna().any():
+            log_progress("⚠️ Some articles could not be scored; result not cached")
+        else:
+            tmp_path = None
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                # Write to a temporary file and swap it in, so concurrent readers never see a partial pickle
+                fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.pkl.tmp')
+                os.close(fd)
+                df.to_pickle(tmp_path)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                print(f"⚠️ Could not write articles cache: {str(e)}")
+                if tmp_path and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        
         return df
         
     except Exception as e:
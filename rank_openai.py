@@ -1,31 +1,90 @@
+import asyncio
+from contextlib import AsyncExitStack
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
+import httpx
+import json
 import openai
 import pandas as pd
-import time
 import math
-from typing import List, Optional, Dict
-from dataclasses import dataclass
+import numpy as np
+from typing import Any, Callable, List, Optional, Dict, Tuple
+from dataclasses import dataclass, field
+import random
 import re
 import os
+import time
+import tiktoken
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from config import check_environment_variables
+from llm_cache import (
+    get_cached_reply, lookup_semantic_scores, request_key, store_reply, store_semantic_scores
+)
 
-# Load environment variables
-load_dotenv()
+# Keep-alive connection pool shared by concurrent requests, so they reuse TCP+TLS connections
+# over HTTP/2, which multiplexes them on a few connections instead of one connection per request
+HTTP_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16, keepalive_expiry=60)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
 
-# Check environment variables
-check_environment_variables()
-
-# Initialize OpenAI client with API key from environment
-client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'),
-    base_url="https://api.openai.com/v1")
+OPENAI_BASE_URL = "https://api.openai.com/v1"
 
 # API Configuration
 MODEL_NAME = "gpt-4o-mini"
-DEFAULT_BATCH_SIZE = 10
-RATE_LIMIT_DELAY = 1.2  # seconds
+# Scoring only returns a 1-10 number per article, so it can run on a smaller, faster model
+# (e.g. gpt-4.1-nano) through OPENAI_SCORING_MODEL; summaries and posts stay on MODEL_NAME
+SCORING_MODEL = os.getenv('OPENAI_SCORING_MODEL') or MODEL_NAME
+DEFAULT_BATCH_SIZE = 40  # article summaries scored per request, amortizing the long system prompt
+# Batches are also closed early once their article blocks reach this many tokens
+MAX_BATCH_INPUT_TOKENS = 6000
+ARTICLE_BLOCK_TOKENS = 6  # "---" separator and "Article k:" header around each text
+CHARS_PER_TOKEN = 4  # rough estimate used when the tokenizer cannot be loaded
+MAX_CONCURRENT_REQUESTS = 10  # scoring batches in flight at once
+# Completion budget of a scoring request, sized to the {"id": k, "score": N} entries it has to return
+SCORING_TOKENS_PER_ARTICLE = 14
+SCORING_TOKENS_PER_BATCH_FIELD = 5  # per article of a merged request, for its "batch" field
+SCORING_TOKENS_OVERHEAD = 20  # per request
+BULLET_POINTS_MAX_TOKENS = 900  # six bullets of at most ~500 characters plus the header line
+SUPER_BATCH_INSTRUCTIONS = """
+The articles are grouped into batches, each introduced by a line "=== BATCH k ===".
+Give each score entry the number k of its batch in "batch", and the article's number within that batch in "id".
+"""
+
+# Client-side throttling, matched to the account's rate limits
+MAX_REQUESTS_PER_MINUTE = 500
+MAX_TOKENS_PER_MINUTE = 200_000
+MAX_ATTEMPTS = 5  # per request, on rate-limit, server and connection errors
+# Transient failures worth retrying; timeouts (a kind of connection error) have their own budget.
+# httpx errors raised while reading a stream reach us unwrapped by the SDK.
+RETRYABLE_ERRORS = (
+    openai.RateLimitError, openai.InternalServerError, openai.APIConnectionError, httpx.TransportError
+)
+TIMEOUT_ERRORS = (openai.APITimeoutError, httpx.TimeoutException, asyncio.TimeoutError)
+
+# Scoring requests stuck in the latency tail are abandoned and resent
+REQUEST_TIMEOUT = 20  # seconds without progress: until the first chunk, then between chunks
+TIMEOUT_ATTEMPTS = 3  # per request, on timeouts
+
+# OpenAI Batch API: half the price, results within 24h; only worth it for large offline runs
+SCORING_MODES = ("realtime", "batch")
+BATCH_API_MIN_ARTICLES = 200
+BATCH_API_POLL_INTERVAL = 30  # seconds, before the first status check
+BATCH_API_MAX_POLL_INTERVAL = 10 * 60  # seconds; the interval grows 1.5x per check up to this
+
+# Semantic cache: reuse the score of a previously scored article this similar (cosine)
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_BATCH_SIZE = 2048  # maximum inputs per embeddings request
+SEMANTIC_CACHE_THRESHOLD = 0.95
+SEMANTIC_CACHE_MIN_CHARS = 100  # shorter texts (e.g. bare titles) are too terse to match safely
+
+# How long cached replies are reused, in seconds
+SCORING_CACHE_TTL = 7 * 24 * 60 * 60
+BULLET_POINTS_CACHE_TTL = 7 * 24 * 60 * 60
+LINKEDIN_POST_CACHE_TTL = 7 * 24 * 60 * 60
 
 # Prompt Configuration
+# Sent byte-identical as the system message of every scoring request. OpenAI only caches prompt
+# prefixes of 1024+ tokens, which the calibration examples take it past.
 PROMPT_TEMPLATE = """
 You are curating daily tech news for the founder of a €200M AI Gaming fund to help him grow his thought leadership on LinkedIn.
 
@@ -79,20 +138,59 @@ For each article summary, assign a **relevance score from 1 to 10**, based on th
 
 ---
 
+📚 Calibration Examples (summaries and the scores they deserve):
+
+- "A studio ships LLM-driven NPCs in its open-world RPG, with dialogue generated at runtime, and shares the impact on player retention." → **10** (AI + Gaming with strategic depth)
+- "A mobile publisher reports that generative AI cut art production time by 40% across three of its live games." → **9** (AI + Gaming, concrete use case)
+- "A game engine adds an AI assistant that generates playable level prototypes from text prompts, shown in a live demo." → **9** (AI + Gaming tools with a real demo)
+- "Google open-sources a protocol that lets AI agents from different vendors discover each other and delegate tasks." → **10** (major agentic breakthrough)
+- "A startup raises $30M to sell AI agents that automate customer support for e-commerce brands." → **6** (business use of agents)
+- "A chipmaker announces a new AI accelerator with bold performance claims but no benchmarks." → **4** (mostly marketing)
+- "A new open-weights LLM tops coding benchmarks and comes with a detailed technical report." → **6** (generic AI, capped at 6)
+- "A blockchain game launches AI agents that trade in-game assets on-chain, with a technical write-up of the agent design." → **7** (strong, but Web3-driven: –1 penalty)
+- "The Stanford AI Index publishes its annual report on AI investment, capabilities and adoption." → **9** (major industry report)
+- "An opinion column argues that AI will make game designers obsolete, without data or examples." → **5** (opinion without original depth)
+- "A hospital network deploys an AI model to triage radiology scans." → **5** (generic AI outside gaming and agents)
+- "A crypto exchange lists a new token themed around AI agents." → **2** (Web3 hype without real AI)
+- "A console maker reveals next year's hardware lineup, with no AI features." → **2** (no AI relevance)
+- "A gaming studio lays off 200 staff after a disappointing launch." → **1** (no AI relevance)
+
+---
+
 💬 Output Format:
-Article 1: 7  
-Article 2: 3  
-...
+A JSON object with one entry per article:
+{"scores": [{"id": 1, "score": 7}, {"id": 2, "score": 3}, ...]}
 
 Ask yourself: *Would this make a strong LinkedIn post for someone leading a €200M AI Gaming fund, focusing on the future of AI in gaming and interactivity?*
 """
 
+# Semantic cache entries are only reused with the same scoring model, prompt and embedding model
+SEMANTIC_CACHE_SCORER = request_key(
+    f"{SCORING_MODEL}|{EMBEDDING_MODEL}", [{"role": "system", "content": PROMPT_TEMPLATE}], 0
+)
 
-LINKEDIN_PROMPT_TEMPLATE = """You are the Head of Content for WarpzoneAI, a €200M investment fund dedicated to mobile gaming with a focus on AI integration. Create an engaging LinkedIn post about the following article that positions WarpzoneAI as a thought leader and sparks engagement from founders, developers, and industry peers.
 
-Article Title: {title}
-Article Summary: {summary}
-Keywords: {keywords}
+BULLET_POINTS_SYSTEM_PROMPT = """You are an expert at analyzing gaming and AI news articles.
+                Create a detailed bullet points summary of the article following this exact format:
+                
+                Key News Item: [Title] (Link)
+                ● [Main point 1]
+                ● [Main point 2]
+                ● [Main point 3]
+                ● [Main point 4]
+                ● [Main point 5]
+                ● <strong>Why does this matter to AI x Gaming:</strong> [Explanation of the article's significance to AI in gaming]
+                
+                Make sure to:
+                1. Extract the most important points from the article
+                2. Focus on facts, numbers, and specific details
+                3. End with a clear explanation of why this matters to AI in gaming
+                4. Keep each bullet point concise but informative
+                5. Each bullet point should be 300 to 500 characters long
+                6. Use the exact format shown above"""
+
+# Static instructions go in the system message so every request shares the same cacheable prefix
+LINKEDIN_SYSTEM_PROMPT = """You are the Head of Content for WarpzoneAI, a €200M investment fund dedicated to mobile gaming with a focus on AI integration. Create an engaging LinkedIn post about the article provided by the user that positions WarpzoneAI as a thought leader and sparks engagement from founders, developers, and industry peers.
 
 Guidelines for the post:
 1. Start with a strong hook that grabs attention within the first 3 lines
@@ -103,16 +201,177 @@ Guidelines for the post:
 6. Add 3–5 well-placed emojis to break the text and add personality
 7. End with a thought-provoking question or clear call to action
 8. Keep it within 1300 characters (LinkedIn's limit)
-9. Include the article URL at the end
+9. Do not write the article URL: it is appended after the post automatically
 
-Article URL: {url}
+Write the post in a format ready to be copied and pasted to LinkedIn."""
 
-Write the post in a format ready to be copied and pasted to LinkedIn:"""
+LINKEDIN_PROMPT_TEMPLATE = """Article Title: {title}
+Article Summary: {summary}
+Keywords: {keywords}
+Article URL: {url}"""
 
 class OpenAIError(Exception):
     """Custom exception for OpenAI API errors."""
     pass
 
+@functools.cache
+def get_client() -> OpenAI:
+    """Create the OpenAI client on first use, loading and validating the environment once per process."""
+    load_dotenv()
+    check_environment_variables()
+    return OpenAI(
+        api_key=os.getenv('OPENAI_API_KEY'),
+        base_url=OPENAI_BASE_URL,
+        max_retries=MAX_ATTEMPTS - 1,  # The SDK backs off with jitter and honours Retry-After
+        http_client=httpx.Client(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+    )
+
+@functools.cache
+def openai_api_keys() -> List[str]:
+    """
+    Return the keys scoring requests are spread across: the optional comma-separated
+    OPENAI_API_KEYS (e.g. several projects, whose rate limits add up), else OPENAI_API_KEY.
+    """
+    get_client()  # Loads and validates the environment
+    keys = [key.strip() for key in os.getenv('OPENAI_API_KEYS', '').split(',') if key.strip()]
+    return keys or [os.getenv('OPENAI_API_KEY')]
+
+class RateLimiter:
+    """
+    Token buckets for requests and tokens per minute, refilled continuously as time passes
+    (the scheme used by the openai-cookbook api_request_parallel_processor).
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.max_request_capacity = requests_per_minute
+        self.max_token_capacity = tokens_per_minute
+        self.available_request_capacity = requests_per_minute
+        self.available_token_capacity = tokens_per_minute
+        self.last_update_time = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the capacity regained since the last update."""
+        now = time.monotonic()
+        elapsed = now - self.last_update_time
+        self.available_request_capacity = min(
+            self.max_request_capacity,
+            self.available_request_capacity + self.max_request_capacity * elapsed / 60
+        )
+        self.available_token_capacity = min(
+            self.max_token_capacity,
+            self.available_token_capacity + self.max_token_capacity * elapsed / 60
+        )
+        self.last_update_time = now
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request and `tokens` tokens are available, then consume them."""
+        tokens = min(tokens, self.max_token_capacity)
+        while True:
+            self._refill()
+            if self.available_request_capacity >= 1 and self.available_token_capacity >= tokens:
+                self.available_request_capacity -= 1
+                self.available_token_capacity -= tokens
+                return
+            # Sleep just long enough for the scarcer bucket to refill
+            wait = max(
+                (1 - self.available_request_capacity) * 60 / self.max_request_capacity,
+                (tokens - self.available_token_capacity) * 60 / self.max_token_capacity
+            )
+            await asyncio.sleep(max(wait, 0.01))
+
+    def sync(self, headers: httpx.Headers) -> None:
+        """
+        Align the buckets with the x-ratelimit-* headers of a response, so requests only wait
+        when the account's actual remaining quota runs low.
+        """
+        self._refill()
+        try:
+            if 'x-ratelimit-limit-requests' in headers:
+                self.max_request_capacity = float(headers['x-ratelimit-limit-requests'])
+            if 'x-ratelimit-limit-tokens' in headers:
+                self.max_token_capacity = float(headers['x-ratelimit-limit-tokens'])
+            if 'x-ratelimit-remaining-requests' in headers:
+                self.available_request_capacity = min(
+                    self.max_request_capacity, float(headers['x-ratelimit-remaining-requests'])
+                )
+            if 'x-ratelimit-remaining-tokens' in headers:
+                self.available_token_capacity = min(
+                    self.max_token_capacity, float(headers['x-ratelimit-remaining-tokens'])
+                )
+        except ValueError:
+            pass  # Keep the local estimate
+
+def retry_delay(error: openai.APIError, attempt: int) -> float:
+    """
+    Return how long to wait before retrying a failed request: the delay the API asks for
+    in its Retry-After headers when present, else exponential backoff with jitter.
+    
+    Args:
+        error (openai.APIError): The error the request failed with
+        attempt (int): Number of attempts made so far
+        
+    Returns:
+        float: Delay in seconds
+    """
+    response = getattr(error, 'response', None)  # Connection errors have no response
+    headers = response.headers if response is not None else {}
+    try:
+        if 'retry-after-ms' in headers:
+            return float(headers['retry-after-ms']) / 1000 + random.random()
+        if 'retry-after' in headers:
+            return float(headers['retry-after']) + random.random()
+    except ValueError:
+        pass  # An HTTP date rather than a number of seconds
+    return 2 ** attempt + random.random()
+
+@functools.cache
+def _encoding() -> Optional[tiktoken.Encoding]:
+    """Tokenizer for MODEL_NAME, loaded on first use; None if it cannot be loaded."""
+    try:
+        # The encoding file is downloaded on first use in a fresh environment
+        return tiktoken.encoding_for_model(MODEL_NAME)
+    except Exception as e:
+        print(f"⚠️ Could not load the tokenizer, estimating token counts instead: {str(e)}")
+        return None
+
+def count_tokens(text: str) -> int:
+    """Count the prompt tokens of a text for MODEL_NAME (special-token markers count as plain text)."""
+    encoding = _encoding()
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN
+    return len(encoding.encode_ordinary(text))
+
+def count_tokens_batch(texts: List[str]) -> List[int]:
+    """Count the prompt tokens of many texts at once, encoding them on tiktoken's thread pool."""
+    encoding = _encoding()
+    if encoding is None:
+        return [len(text) // CHARS_PER_TOKEN for text in texts]
+    return [len(tokens) for tokens in encoding.encode_ordinary_batch(texts)]
+
+def batch_boundaries(token_counts: List[int], max_articles: int, max_tokens: int) -> List[Tuple[int, int]]:
+    """
+    Greedily pack consecutive articles into batches of at most `max_articles` articles
+    and `max_tokens` prompt tokens; an article longer than `max_tokens` gets a batch of its own.
+    
+    Args:
+        token_counts (List[int]): Prompt tokens of each article block, in order
+        max_articles (int): Maximum number of articles per batch
+        max_tokens (int): Token budget of a batch's article blocks
+        
+    Returns:
+        List[Tuple[int, int]]: (start, end) index ranges of the batches
+    """
+    boundaries = []
+    start = total = 0
+    for i, tokens in enumerate(token_counts):
+        if i > start and (i - start == max_articles or total + tokens > max_tokens):
+            boundaries.append((start, i))
+            start, total = i, 0
+        total += tokens
+    if start < len(token_counts):
+        boundaries.append((start, len(token_counts)))
+    return boundaries
+
 @dataclass
 class ArticleBatch:
     """Data class to handle article batches."""
@@ -122,31 +381,208 @@ class ArticleBatch:
     batch_number: int
     total_batches: int
     prompt: str
+    # Article counts of the batches merged into this request (empty for a plain batch)
+    sub_batch_sizes: List[int] = field(default_factory=list)
+
+# One complete {"id": 3, "score": 7} entry; the enclosing {"scores": [...]} never matches as it nests braces
+SCORE_ENTRY_RE = re.compile(r'\{[^{}]*\}')
+
+def merge_batches(batches: List[ArticleBatch], batch_number: int, total_batches: int) -> ArticleBatch:
+    """
+    Merge consecutive batches into a single request, each section introduced by a
+    "=== BATCH k ===" header and numbering its articles from 1.
+    
+    Args:
+        batches (List[ArticleBatch]): Consecutive batches to merge
+        batch_number (int): Number of the merged batch
+        total_batches (int): Total number of merged batches
+        
+    Returns:
+        ArticleBatch: Batch covering the articles of all merged batches
+    """
+    return ArticleBatch(
+        summaries=[summary for batch in batches for summary in batch.summaries],
+        start_index=batches[0].start_index,
+        end_index=batches[-1].end_index,
+        batch_number=batch_number,
+        total_batches=total_batches,
+        prompt="".join(f"\n=== BATCH {k} ===\n{batch.prompt}" for k, batch in enumerate(batches, 1)),
+        sub_batch_sizes=[len(batch.summaries) for batch in batches]
+    )
+
+def _scoring_text_series(df: pd.DataFrame) -> pd.Series:
+    """Vectorized selection of each article's scoring text: its summary, or its title when the summary is empty."""
+    # .str.strip() yields NaN for non-string cells, which then fall back like empty ones
+    summaries = df['Summary'].str.strip().fillna('')
+    titles = df['Title'].str.strip().fillna('')
+    return summaries.where(summaries != '', titles)
+
+def scoring_texts(df: pd.DataFrame) -> List[str]:
+    """Return the text each article is scored on: its summary, or its title when the summary is empty."""
+    return _scoring_text_series(df).tolist()
+
+def dedup_key(text: str) -> str:
+    """Normalize a text (case and whitespace) so copies of the same article compare equal."""
+    return ' '.join(text.split()).lower()
 
-def format_prompt(df_batch: pd.DataFrame) -> str:
+def embed_texts(texts: List[str]) -> np.ndarray:
     """
-    Format the prompt for OpenAI API with article summaries.
+    Embed texts with EMBEDDING_MODEL, batching the requests.
     
     Args:
-        df_batch (pd.DataFrame): Batch of articles to process
+        texts (List[str]): Texts to embed
         
     Returns:
-        str: Formatted prompt with article summaries
+        np.ndarray: L2-normalized float32 embeddings, one row per text
+    """
+    vectors = []
+    for start in range(0, len(texts), EMBEDDING_BATCH_SIZE):
+        response = get_client().embeddings.create(model=EMBEDDING_MODEL, input=texts[start:start + EMBEDDING_BATCH_SIZE])
+        vectors.extend(item.embedding for item in response.data)
+    embeddings = np.array(vectors, dtype=np.float32)
+    return embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+def format_article_blocks(texts: List[str]) -> str:
+    """Number the scoring texts of a batch into the article blocks of the user message."""
+    return "".join(f"\n---\nArticle {i}:\n{text}\n" for i, text in enumerate(texts, 1))
+
+def scoring_system_prompt(batch: ArticleBatch) -> str:
+    """Return the scoring instructions for a batch, with the output layout of merged batches if needed."""
+    return PROMPT_TEMPLATE + SUPER_BATCH_INSTRUCTIONS if batch.sub_batch_sizes else PROMPT_TEMPLATE
+
+def scoring_max_tokens(batch: ArticleBatch) -> int:
+    """Return the completion budget of a (possibly merged) batch."""
+    return (
+        (SCORING_TOKENS_PER_ARTICLE + (SCORING_TOKENS_PER_BATCH_FIELD if batch.sub_batch_sizes else 0))
+        * len(batch.summaries)
+        + SCORING_TOKENS_OVERHEAD
+    )
+
+def scoring_response_format(batch: ArticleBatch) -> Dict[str, Any]:
+    """Return the JSON schema the scoring reply of a batch is constrained to; merged batches add a "batch" field."""
+    fields = ["batch", "id", "score"] if batch.sub_batch_sizes else ["id", "score"]
+    entry = {
+        "type": "object",
+        "properties": {name: {"type": "integer"} for name in fields},
+        "required": fields,
+        "additionalProperties": False
+    }
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "article_scores",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {"scores": {"type": "array", "items": entry}},
+                "required": ["scores"],
+                "additionalProperties": False
+            }
+        }
+    }
+
+def scoring_messages(batch: ArticleBatch) -> List[Dict[str, str]]:
+    """Build the chat messages that score a batch of articles."""
+    return [
+        {"role": "system", "content": scoring_system_prompt(batch)},
+        {"role": "user", "content": batch.prompt}
+    ]
+
+class ScoreReplyParser:
+    """
+    Incremental parser of a JSON scoring reply: each score entry is parsed as soon as its
+    closing brace arrives, so a streamed reply is mostly parsed by the time its last chunk lands.
     """
-    prompt = PROMPT_TEMPLATE
 
-    for i, row in enumerate(df_batch.itertuples(), 1):
-        text = row.Summary.strip() if isinstance(row.Summary, str) and row.Summary.strip() else row.Title.strip()
-        prompt += f"\n---\nArticle {i}:\n{text}\n"
+    def __init__(self, batch: ArticleBatch):
+        self.sizes = batch.sub_batch_sizes or [len(batch.summaries)]
+        self.offsets = [sum(self.sizes[:k]) for k in range(len(self.sizes))]
+        self.scores = [None] * len(batch.summaries)
+        self.merged = bool(batch.sub_batch_sizes)
+        self.parts = []
+        self._buffer = ""
+
+    @property
+    def text(self) -> str:
+        """The full reply received so far."""
+        return "".join(self.parts)
+
+    def feed(self, chunk: str) -> None:
+        """Consume a chunk of the reply, parsing every score entry it completes."""
+        self.parts.append(chunk)
+        self._buffer += chunk
+        consumed = 0
+        for match in SCORE_ENTRY_RE.finditer(self._buffer):
+            self._parse_entry(match.group())
+            consumed = match.end()
+        self._buffer = self._buffer[consumed:]
+
+    def close(self) -> List[Optional[int]]:
+        """Return the scores aligned with the batch's articles; a truncated last entry is dropped."""
+        self._buffer = ""
+        return self.scores
+
+    def _parse_entry(self, text: str) -> None:
+        try:
+            entry = json.loads(text)
+        except ValueError:
+            return
+        fields = ("batch", "id", "score") if self.merged else ("id", "score")
+        if not all(isinstance(entry.get(name), int) for name in fields):
+            return
+        section = entry["batch"] - 1 if self.merged else 0
+        idx = entry["id"] - 1
+        score = entry["score"]
+        if not (0 <= section < len(self.sizes) and 0 <= idx < self.sizes[section]):
+            return
+        if 1 <= score <= 10:  # Only accept valid scores
+            self.scores[self.offsets[section] + idx] = score
+
+def is_complete_reply(finish_reason: Optional[str], scores: List[Optional[int]]) -> bool:
+    """
+    Tell whether a scoring reply is worth caching: a reply cut off by max_tokens, or one
+    that skipped or mangled an article, would otherwise be replayed on every retry.
+    
+    Args:
+        finish_reason (Optional[str]): Why the model stopped generating the reply
+        scores (List[Optional[int]]): The scores parsed from the reply
+        
+    Returns:
+        bool: True if the model finished normally and every article got a score
+    """
+    return finish_reason == "stop" and all(score is not None for score in scores)
 
-    return prompt
+def parse_batch_reply(reply: str, batch: ArticleBatch) -> List[Optional[int]]:
+    """
+    Extract the scores of every article of a batch from the model reply.
+    
+    Args:
+        reply (str): The model reply
+        batch (ArticleBatch): The batch the reply answers, plain or merged
+        
+    Returns:
+        List[Optional[int]]: Scores aligned with batch.summaries, None where missing
+    """
+    parser = ScoreReplyParser(batch)
+    parser.feed(reply)
+    return parser.close()
 
-def process_batch(batch: ArticleBatch) -> List[Optional[int]]:
+async def aprocess_batch(
+    batch: ArticleBatch,
+    aclient: AsyncOpenAI,
+    semaphore: asyncio.Semaphore,
+    rate_limiter: RateLimiter,
+    request_timeout: float = REQUEST_TIMEOUT
+) -> List[Optional[int]]:
     """
     Process a batch of articles through the OpenAI API.
     
     Args:
         batch (ArticleBatch): Batch of articles to process
+        aclient (AsyncOpenAI): Async client shared by all batches of the run
+        semaphore (asyncio.Semaphore): Caps the number of requests in flight
+        rate_limiter (RateLimiter): Request/token budget shared by all batches of the run
+        request_timeout (float): Seconds without a new chunk after which a request is abandoned and retried
         
     Returns:
         List[Optional[int]]: List of scores for the batch
@@ -155,35 +591,168 @@ def process_batch(batch: ArticleBatch) -> List[Optional[int]]:
         OpenAIError: If the API request fails
     """
     try:
-        response = client.chat.completions.create(
-            model=MODEL_NAME,
-            messages=[{"role": "user", "content": batch.prompt}],
-            temperature=0,
-            max_tokens=500
-        )
-        
-        scores = [None] * len(batch.summaries)
-        reply = response.choices[0].message.content
+        messages = scoring_messages(batch)
+        # Scoring runs at temperature 0, so an identical request gets an identical reply
+        cache_key = request_key(SCORING_MODEL, messages, 0)
+        reply = get_cached_reply(cache_key, SCORING_CACHE_TTL)
 
-        for line in reply.strip().split('\n'):
-            if ':' in line:
-                try:
-                    idx, score = line.split(':')
-                    idx = int(idx.strip().replace("Article", "")) - 1
-                    # Try to extract the first number from the score part
-                    numbers = re.findall(r'\d+', score.strip())
-                    if numbers:
-                        score = int(numbers[0])
-                        if 1 <= score <= 10:  # Only accept valid scores
-                            scores[idx] = score
-                except (ValueError, IndexError):
-                    continue
+        if reply is None:
+            # Budget for the prompt plus the largest possible completion
+            tokens = count_tokens(messages[0]["content"]) + count_tokens(batch.prompt) + scoring_max_tokens(batch)
 
-        return scores
+            async def stream_reply() -> Tuple[ScoreReplyParser, Optional[str]]:
+                raw_response = await asyncio.wait_for(
+                    aclient.chat.completions.with_raw_response.create(
+                        model=SCORING_MODEL,
+                        messages=messages,
+                        temperature=0,
+                        max_tokens=scoring_max_tokens(batch),
+                        response_format=scoring_response_format(batch),
+                        stream=True,
+                        stream_options={"include_usage": True},
+                        timeout=request_timeout
+                    ),
+                    request_timeout
+                )
+                rate_limiter.sync(raw_response.headers)
+                stream = raw_response.parse()
+                # Parse score entries while the rest of the reply is still generating
+                parser = ScoreReplyParser(batch)
+                finish_reason = None
+                # The deadline applies to each chunk, not the whole reply: large or
+                # merged batches legitimately stream for longer than request_timeout
+                chunks = stream.__aiter__()
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), request_timeout)
+                    except StopAsyncIteration:
+                        break
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        parser.feed(chunk.choices[0].delta.content)
+                    if chunk.choices and chunk.choices[0].finish_reason:
+                        finish_reason = chunk.choices[0].finish_reason
+                    if chunk.usage:  # Sent alone in the last chunk
+                        details = chunk.usage.prompt_tokens_details
+                        cached_tokens = details.cached_tokens if details and details.cached_tokens else 0
+                        print(
+                            f"📊 Batch {batch.batch_number}: {chunk.usage.prompt_tokens} prompt tokens "
+                            f"({cached_tokens} cached), {chunk.usage.completion_tokens} completion tokens"
+                        )
+                return parser, finish_reason
+
+            attempt = timeouts = 0
+            while True:
+                await rate_limiter.acquire(tokens)
+                try:
+                    async with semaphore:
+                        print(f"🔍 Processing batch {batch.batch_number}/{batch.total_batches}")
+                        parser, finish_reason = await stream_reply()
+                    break
+                except TIMEOUT_ERRORS:
+                    timeouts += 1
+                    if timeouts == TIMEOUT_ATTEMPTS:
+                        raise
+                    print(f"⌛ Batch {batch.batch_number} stalled for {request_timeout}s, retrying ({timeouts}/{TIMEOUT_ATTEMPTS})")
+                except RETRYABLE_ERRORS as e:
+                    attempt += 1
+                    if attempt == MAX_ATTEMPTS:
+                        raise
+                    delay = retry_delay(e, attempt)
+                    print(f"⏳ Batch {batch.batch_number} failed ({type(e).__name__}), retrying in {delay:.1f}s ({attempt}/{MAX_ATTEMPTS})")
+                    await asyncio.sleep(delay)
+            scores = parser.close()
+            if is_complete_reply(finish_reason, scores):
+                store_reply(cache_key, parser.text)
+            else:
+                print(f"⚠️ Batch {batch.batch_number}: incomplete reply (finish reason: {finish_reason}), not cached")
+            return scores
+        
+        print(f"💾 Batch {batch.batch_number}/{batch.total_batches} served from cache")
+        return parse_batch_reply(reply, batch)
 
     except Exception as e:
         raise OpenAIError(f"Failed to process batch {batch.batch_number}: {str(e)}")
 
+def submit_batch_scoring(batches: List[ArticleBatch]) -> List:
+    """
+    Score batches through the OpenAI Batch API and wait for the job to finish.
+    
+    Args:
+        batches (List[ArticleBatch]): Batches of articles to score
+        
+    Returns:
+        List: Per-batch score lists, or an OpenAIError for a batch without a result
+        
+    Raises:
+        OpenAIError: If the batch job cannot be submitted or produces no output
+    """
+    results = [OpenAIError(f"No result for batch {batch.batch_number}") for batch in batches]
+    
+    # One JSONL request per batch not already in the response cache
+    lines = []
+    for i, batch in enumerate(batches):
+        messages = scoring_messages(batch)
+        cached = get_cached_reply(request_key(SCORING_MODEL, messages, 0), SCORING_CACHE_TTL)
+        if cached is not None:
+            results[i] = parse_batch_reply(cached, batch)
+            continue
+        lines.append(json.dumps({
+            "custom_id": f"batch-{i}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": SCORING_MODEL,
+                "messages": messages,
+                "temperature": 0,
+                "max_tokens": scoring_max_tokens(batch),
+                "response_format": scoring_response_format(batch)
+            }
+        }))
+    if not lines:
+        return results
+    
+    try:
+        input_file = get_client().files.create(file=("scoring.jsonl", "\n".join(lines).encode()), purpose="batch")
+        job = get_client().batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"📦 Submitted {len(lines)} scoring requests as batch job {job.id}")
+        
+        poll_interval = BATCH_API_POLL_INTERVAL
+        while job.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 1.5, BATCH_API_MAX_POLL_INTERVAL)
+            job = get_client().batches.retrieve(job.id)
+            print(f"⏳ Batch job {job.id}: {job.status}")
+        
+        if not job.output_file_id:
+            raise OpenAIError(f"Batch job {job.id} ended with status {job.status} and no output")
+        output = get_client().files.content(job.output_file_id).text
+    except openai.OpenAIError as e:
+        raise OpenAIError(f"Batch scoring failed: {str(e)}")
+    
+    # An expired job still returns the requests it completed
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        i = int(item["custom_id"].split("-")[1])
+        response = item.get("response") or {}
+        if response.get("status_code") != 200:
+            results[i] = OpenAIError(f"Failed to process batch {batches[i].batch_number}: {item.get('error') or response.get('body')}")
+            continue
+        choice = response["body"]["choices"][0]
+        reply = choice["message"]["content"] or ""
+        results[i] = parse_batch_reply(reply, batches[i])
+        if is_complete_reply(choice.get("finish_reason"), results[i]):
+            store_reply(request_key(SCORING_MODEL, scoring_messages(batches[i]), 0), reply)
+        else:
+            print(f"⚠️ Batch {batches[i].batch_number}: incomplete reply (finish reason: {choice.get('finish_reason')}), not cached")
+    
+    return results
+
 def generate_bullet_points_summary(title: str, content: str) -> str:
     """
     Generate a bullet points summary of the article in the specified format.
@@ -196,90 +765,228 @@ def generate_bullet_points_summary(title: str, content: str) -> str:
         str: Formatted bullet points summary
     """
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": """You are an expert at analyzing gaming and AI news articles.
-                Create a detailed bullet points summary of the article following this exact format:
-                
-                Key News Item: [Title] (Link)
-                ● [Main point 1]
-                ● [Main point 2]
-                ● [Main point 3]
-                ● [Main point 4]
-                ● [Main point 5]
-                ● <strong>Why does this matter to AI x Gaming:</strong> [Explanation of the article's significance to AI in gaming]
-                
-                Make sure to:
-                1. Extract the most important points from the article
-                2. Focus on facts, numbers, and specific details
-                3. End with a clear explanation of why this matters to AI in gaming
-                4. Keep each bullet point concise but informative
-                5. Each bullet point should be 300 to 500 characters long
-                6. Use the exact format shown above"""},
-                {"role": "user", "content": f"Title: {title}\n\nContent: {content}"}
-            ],
+        messages = [
+            {"role": "system", "content": BULLET_POINTS_SYSTEM_PROMPT},
+            {"role": "user", "content": f"Title: {title}\n\nContent: {content}"}
+        ]
+        cache_key = request_key(MODEL_NAME, messages, 0.7)
+        cached = get_cached_reply(cache_key, BULLET_POINTS_CACHE_TTL)
+        if cached is not None:
+            return cached
+
+        response = get_client().chat.completions.create(
+            model=MODEL_NAME,
+            messages=messages,
             temperature=0.7,
-            max_tokens=1000
+            max_tokens=BULLET_POINTS_MAX_TOKENS
         )
         
-        return response.choices[0].message.content.strip()
+        summary = response.choices[0].message.content.strip()
+        store_reply(cache_key, summary)
+        return summary
         
     except Exception as e:
         print(f"Error generating bullet points summary: {str(e)}")
         return "Error generating summary"
 
-def batch_gpt_scoring(df: pd.DataFrame, column: str, batch_size: int = 15) -> pd.DataFrame:
+async def _score_batches(
+    batches: List[ArticleBatch],
+    max_concurrency: int,
+    request_timeout: float = REQUEST_TIMEOUT,
+    on_result: Optional[Callable[[ArticleBatch, Any], None]] = None
+) -> List:
+    """
+    Score all batches concurrently, with at most `max_concurrency` requests in flight,
+    handing each result to `on_result` as soon as its batch completes.
+    
+    The async clients are created per run because their connection pools are bound to the
+    event loop that asyncio.run() creates and closes around this coroutine. Batches are
+    spread round-robin over openai_api_keys(), each key with its own rate limiter.
+    
+    Each pool holds at least `max_concurrency` connections, so that if HTTP/2 is not negotiated
+    the semaphore, not the pool, is what limits concurrency.
+    
+    Returns:
+        List: Per-batch score lists, or the exception raised for a failed batch
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    pool_size = max(HTTP_LIMITS.max_connections, max_concurrency)
+    limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size, keepalive_expiry=HTTP_LIMITS.keepalive_expiry)
+    async with AsyncExitStack() as stack:
+        aclients = [
+            await stack.enter_async_context(AsyncOpenAI(
+                api_key=api_key,
+                base_url=OPENAI_BASE_URL,
+                max_retries=0,  # aprocess_batch retries, going through the rate limiter again
+                http_client=httpx.AsyncClient(http2=True, limits=limits, timeout=HTTP_TIMEOUT)
+            ))
+            for api_key in openai_api_keys()
+        ]
+        rate_limiters = [RateLimiter(MAX_REQUESTS_PER_MINUTE, MAX_TOKENS_PER_MINUTE) for _ in aclients]
+
+        async def score(b: int, batch: ArticleBatch) -> Tuple[int, Any]:
+            try:
+                return b, await aprocess_batch(
+                    batch, aclients[b % len(aclients)], semaphore, rate_limiters[b % len(aclients)], request_timeout
+                )
+            except Exception as e:
+                return b, e
+
+        results = [None] * len(batches)
+        tasks = [score(b, batch) for b, batch in enumerate(batches)]
+        for done, task in enumerate(asyncio.as_completed(tasks), 1):
+            b, result = await task
+            results[b] = result
+            if on_result:
+                on_result(batches[b], result)
+            print(f"📈 {done}/{len(batches)} batches done")
+        return results
+
+def batch_gpt_scoring(
+    df: pd.DataFrame,
+    column: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_batch_tokens: int = MAX_BATCH_INPUT_TOKENS,
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    use_semantic_cache: bool = True,
+    mode: str = "realtime",
+    super_batch_size: int = 1,
+    request_timeout: float = REQUEST_TIMEOUT,
+    on_score: Optional[Callable[[int, int], None]] = None
+) -> pd.DataFrame:
     """
     Process a batch of articles with GPT scoring.
     
     Args:
         df (pd.DataFrame): DataFrame containing articles
         column (str): Name of the column containing article content
-        batch_size (int): Number of articles to process in each batch
+        batch_size (int): Maximum number of articles to process in each batch
+        max_batch_tokens (int): Token budget of the article blocks of each batch
+        max_concurrency (int): Maximum number of batches scored concurrently
+        use_semantic_cache (bool): Reuse scores of near-identical articles scored on earlier runs
+        mode (str): "realtime" for concurrent chat completions, or "batch" to use the
+            OpenAI Batch API when at least BATCH_API_MIN_ARTICLES need scoring (can take hours)
+        super_batch_size (int): Number of batches merged into one request when the requests-per-minute
+            limit is the bottleneck; latency grows non-linearly, so keep it at 3–5 or below
+        request_timeout (float): Seconds without a new chunk after which a realtime scoring request
+            is abandoned and retried
+        on_score (Optional[Callable[[int, int], None]]): Called with the position and score of each
+            article as soon as its score is known, e.g. BulletPointPrefetcher.offer
         
     Returns:
         pd.DataFrame: DataFrame with added GPT scores
     """
+    if mode not in SCORING_MODES:
+        raise ValueError(f"Unknown scoring mode {mode!r}, expected one of {SCORING_MODES}")
+
     try:
-        # Calculate number of batches
-        n_batches = math.ceil(len(df) / batch_size)
-        scores = [None] * len(df)
+        # Keep the scores of articles already scored on an earlier pass (e.g. an incremental run)
+        if 'GPT_Pertinence' in df.columns:
+            scores = [None if pd.isna(score) else int(score) for score in df['GPT_Pertinence'].tolist()]
+        else:
+            scores = [None] * len(df)
+        pending = [pos for pos in range(len(df)) if scores[pos] is None]  # positions GPT still has to score
+        if len(pending) < len(df):
+            print(f"♻️ Keeping {len(df) - len(pending)} existing scores")
+        texts = scoring_texts(df)
         
-        # Score all articles in batches
-        print("🤖 Starting article scoring...")
-        for b in range(n_batches):
-            start_idx = b * batch_size
-            end_idx = min((b + 1) * batch_size, len(df))
-            df_batch = df.iloc[start_idx:end_idx]
-            
-            # Create batch for scoring
-            article_batch = ArticleBatch(
-                summaries=df_batch[column].tolist(),
+        # Reuse the scores of near-identical articles (e.g. syndicated copies) from earlier runs
+        embeddings = None
+        embedded = [pos for pos in pending if len(texts[pos]) >= SEMANTIC_CACHE_MIN_CHARS]  # rows of `embeddings`
+        if use_semantic_cache and embedded:
+            try:
+                embeddings = embed_texts([texts[pos] for pos in embedded])
+                cached = lookup_semantic_scores(
+                    embeddings, SEMANTIC_CACHE_THRESHOLD, SEMANTIC_CACHE_SCORER, SCORING_CACHE_TTL
+                )
+                for pos, score in zip(embedded, cached):
+                    scores[pos] = score
+                n_pending = len(pending)
+                pending = [pos for pos in pending if scores[pos] is None]
+                print(f"🧠 Reused {n_pending - len(pending)} scores from similar articles")
+            except Exception as e:
+                print(f"⚠️ Semantic cache unavailable: {str(e)}")
+                embeddings = None
+        
+        if on_score:
+            for pos, score in enumerate(scores):
+                if score is not None:
+                    on_score(pos, score)
+        
+        # Score each distinct text once; its copies (e.g. the same story from two feeds) share the score
+        first_positions = {}
+        duplicates = {}  # position of a copy -> position of the article actually scored
+        for pos in pending:
+            duplicates[pos] = first_positions.setdefault(dedup_key(texts[pos]), pos)
+        duplicates = {pos: first for pos, first in duplicates.items() if pos != first}
+        if duplicates:
+            pending = [pos for pos in pending if pos not in duplicates]
+            print(f"🧬 Skipping {len(duplicates)} articles identical to another one")
+        # Slice plain lists rather than building a DataFrame view per batch
+        pending_summaries = df[column].to_numpy()[pending].tolist()
+        pending_texts = [texts[pos] for pos in pending]
+        
+        # Pack short articles into fewer batches and keep long ones within the token budget
+        token_counts = [tokens + ARTICLE_BLOCK_TOKENS for tokens in count_tokens_batch(pending_texts)]
+        boundaries = batch_boundaries(token_counts, batch_size, max_batch_tokens)
+        n_batches = len(boundaries)
+        
+        # Build every batch up front so they can be dispatched together
+        batches = []
+        for b, (start_idx, end_idx) in enumerate(boundaries):
+            batches.append(ArticleBatch(
+                summaries=pending_summaries[start_idx:end_idx],
                 start_index=start_idx,
                 end_index=end_idx,
                 batch_number=b + 1,
                 total_batches=n_batches,
-                prompt=format_prompt(df_batch)
-            )
-            
-            print(f"🔍 Processing batch {b + 1}/{n_batches}")
-            
-            # Get GPT scoring for the batch
-            batch_scores = process_batch(article_batch)
-            
-            # Update scores in the list
+                prompt=format_article_blocks(pending_texts[start_idx:end_idx])
+            ))
+        
+        # Row-marshaling: send several batches per request to save requests per minute
+        if super_batch_size > 1:
+            n_requests = math.ceil(len(batches) / super_batch_size)
+            batches = [
+                merge_batches(batches[i:i + super_batch_size], i // super_batch_size + 1, n_requests)
+                for i in range(0, len(batches), super_batch_size)
+            ]
+        
+        def record(batch: ArticleBatch, batch_scores) -> None:
+            """Update scores in the list; a failed batch leaves its articles unscored."""
+            if isinstance(batch_scores, Exception):
+                print(f"❌ {str(batch_scores)}")
+                return
             for idx, score in enumerate(batch_scores):
                 if score is not None:
-                    scores[start_idx + idx] = score
-            
-            # Add a small delay between batches to respect rate limits
-            if b < n_batches - 1:
-                time.sleep(RATE_LIMIT_DELAY)
+                    scores[pending[batch.start_index + idx]] = score
+                    if on_score:
+                        on_score(pending[batch.start_index + idx], score)
+        
+        # Score all articles, through the Batch API for large offline runs or in concurrent batches
+        # whose scores are recorded as each one completes
+        print("🤖 Starting article scoring...")
+        if mode == "batch" and len(pending) >= BATCH_API_MIN_ARTICLES:
+            for batch, batch_scores in zip(batches, submit_batch_scoring(batches)):
+                record(batch, batch_scores)
+        else:
+            asyncio.run(_score_batches(batches, max_concurrency, request_timeout, on_result=record))
+        for pos, first in duplicates.items():
+            scores[pos] = scores[first]
+        
+        # Remember the new scores for the semantic cache
+        if embeddings is not None:
+            rows = {pos: row for row, pos in enumerate(embedded)}
+            scored = [pos for pos in pending if pos in rows and scores[pos] is not None]
+            if scored:
+                store_semantic_scores(
+                    embeddings[[rows[pos] for pos in scored]], [scores[pos] for pos in scored],
+                    SEMANTIC_CACHE_SCORER, SCORING_CACHE_TTL
+                )
         
         # Update DataFrame with all scores
-        df['GPT_Pertinence'] = scores
-        df = df.sort_values('GPT_Pertinence', ascending=False)
+        df['GPT_Pertinence'] = pd.array(scores, dtype='Int64')
+        # Stable descending order, unscored articles last
+        df = df.iloc[np.argsort([-(score or 0) for score in scores], kind='stable')]
         #df['Summary'] = df[column].apply(lambda x: x[:300] + '...' if isinstance(x, str) else '')
         
         return df
@@ -288,6 +995,55 @@ def batch_gpt_scoring(df: pd.DataFrame, column: str, batch_size: int = 15) -> pd
         print(f"❌ Error in batch_gpt_scoring: {str(e)}")
         return df
 
+def bullet_points_input(row: pd.Series, column: str) -> Tuple[str, str]:
+    """Return the (title, content) an article is summarized from, falling back to its summary."""
+    title = row.get('Title', '') or ''
+    content = row[column]
+    if not content:
+        content = row["Summary"]
+    return title, content
+
+class BulletPointPrefetcher:
+    """
+    Starts the bullet-point summaries of top articles while scoring is still running, so that
+    generate_bullet_points_for_top_articles then finds them in the response cache.
+    
+    An article is only summarized once no pending score can push it out of the final top N,
+    so prefetching never costs a request the final pass would not have made.
+    """
+
+    def __init__(self, df: pd.DataFrame, column: str, top_n: int = 5):
+        self.df = df
+        self.column = column
+        self.top_n = top_n
+        self.scores = {}  # position -> score of every article offered so far
+        self.unscored = set(range(len(df)))  # may still get any score, up to 10
+        self.started = set()
+        self.executor = ThreadPoolExecutor(max_workers=max(min(top_n, MAX_CONCURRENT_REQUESTS), 1))
+
+    def _is_certain(self, pos: int, score: int) -> bool:
+        """Whether fewer than top_n articles can still rank above this one (higher score, or same score and earlier)."""
+        if score < 10 and len(self.unscored) >= self.top_n:
+            return False
+        above = sum(1 for other, other_score in self.scores.items() if (other_score, -other) > (score, -pos))
+        above += len(self.unscored) if score < 10 else sum(1 for other in self.unscored if other < pos)
+        return above < self.top_n
+
+    def offer(self, pos: int, score: int) -> None:
+        """Take a new score; start summarizing every article now certain to make the final top N."""
+        self.unscored.discard(pos)
+        self.scores[pos] = score
+        for candidate, candidate_score in self.scores.items():
+            if candidate_score > 7 and candidate not in self.started and self._is_certain(candidate, candidate_score):
+                self.started.add(candidate)
+                self.executor.submit(
+                    generate_bullet_points_summary, *bullet_points_input(self.df.iloc[candidate], self.column)
+                )
+
+    def close(self) -> None:
+        """Wait for the summaries already started, so they are cached before the final pass."""
+        self.executor.shutdown(wait=True)
+
 def generate_bullet_points_for_top_articles(df: pd.DataFrame, column: str, top_n: int = 5) -> pd.DataFrame:
     """
     Generate bullet points summaries for the top N articles.
@@ -302,23 +1058,40 @@ def generate_bullet_points_for_top_articles(df: pd.DataFrame, column: str, top_n
     """
     try:
         # Get top N articles
-        top_articles = df[df['GPT_Pertinence'] > 7].head(5)
+        top_articles = df[df['GPT_Pertinence'] > 7].head(top_n)
         
         print(f"📝 Generating bullet points for top {top_n} articles...")
         
-        # Generate bullet points for each top article
+        # Group identical articles so each distinct one is summarized once
+        groups = {}  # dedup key -> (title, content, indices of the rows sharing them)
         for idx, row in top_articles.iterrows():
-            try:
-                title = row.get('Title', '')
-                content = row[column]
-                if not content:
-                    content = row["Summary"]
-                bullet_points = generate_bullet_points_summary(title, content)
-                df.at[idx, 'Bullet_Points'] = bullet_points
-                print(f"✅ Generated bullet points for article: {title[:50]}...")
-            except Exception as e:
-                print(f"Error generating bullet points for article {idx}: {str(e)}")
-                continue
+            title, content = bullet_points_input(row, column)
+            key = (dedup_key(title), dedup_key(content or ''))
+            groups.setdefault(key, (title, content, []))[2].append(idx)
+        
+        # Generate bullet points for all top articles concurrently
+        # (threads suffice here: the sync client is thread-safe and top_n is small)
+        with ThreadPoolExecutor(max_workers=max(min(len(groups), MAX_CONCURRENT_REQUESTS), 1)) as executor:
+            futures = {
+                executor.submit(generate_bullet_points_summary, title, content): (indices, title)
+                for title, content, indices in groups.values()
+            }
+            
+            labels, summaries = [], []
+            for future in as_completed(futures):
+                indices, title = futures[future]
+                try:
+                    bullet_points = future.result()
+                    labels.extend(indices)
+                    summaries.extend([bullet_points] * len(indices))
+                    print(f"✅ Generated bullet points for article: {title[:50]}...")
+                except Exception as e:
+                    print(f"Error generating bullet points for article {indices[0]}: {str(e)}")
+                    continue
+        
+        # Write every summary in a single assignment rather than one .at lookup per row
+        if labels:
+            df.loc[labels, 'Bullet_Points'] = summaries
                 
         return df
         
@@ -346,15 +1119,26 @@ def generate_linkedin_post(article: Dict) -> str:
             keywords=article['Keywords'],
             url=article['URL']
         )
+        messages = [
+            {"role": "system", "content": LINKEDIN_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+        cache_key = request_key(MODEL_NAME, messages, 0.7)
+        cached = get_cached_reply(cache_key, LINKEDIN_POST_CACHE_TTL)
+        if cached is not None:
+            return cached
 
-        response = client.chat.completions.create(
+        response = get_client().chat.completions.create(
             model=MODEL_NAME,
-            messages=[{"role": "user", "content": prompt}],
+            messages=messages,
             temperature=0.7,  # Slightly higher temperature for more creative writing
             max_tokens=800
         )
         
-        return response.choices[0].message.content.strip()
+        # The URL is known verbatim, so it is appended here rather than decoded token by token
+        post = f"{response.choices[0].message.content.strip()}\n\n{article['URL']}"
+        store_reply(cache_key, post)
+        return post
 
     except Exception as e:
         raise OpenAIError(f"Failed to generate LinkedIn post: {str(e)}")
\ No newline at end of file